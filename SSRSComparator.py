@@ -12,8 +12,10 @@ Description:
     - Loads a CSV of report definitions (name, base URL, optional parameter overrides).
     - For each report, discovers parameters, applies combinations (either from file or discovered),
       renders the report on both servers in parallel, hashes the output rows, and diffs any mismatches.
+    - Compares several reports at once (see "Parallel"), reusing pooled Chrome instances across reports.
     - Normalizes whitespace so embedded timestamps do not trigger false mismatches.
-    - Saves per-combo raw output and unified diff files under `./output/<ReportName>/`.
+    - Saves raw output and diff files for mismatched combos (row diff, or unified with "Rich Diff") under `./output/<ReportName>/`.
+    - Optionally caches combo hashes under `./output/.cache/` so re-runs skip unchanged renders.
     - Presents both user-friendly (INFO/WARN/ERROR) and developer (DEBUG) logs in separate tabs.
     - Bundles ChromeDriver for distribution and handles common transient errors with retries.
 
@@ -28,7 +30,9 @@ Usage:
     6. Click “Compare” to start. Results and diffs are saved under `./output`.
 
 Error Handling:
-    - Retries parameter applications up to 3x on timeouts, stale references, or missing elements.
+    - Retries parameter applications up to 5x on timeouts, stale references, or missing elements,
+      with exponential backoff (stale references retry immediately); page loads retry only on
+      dropped or refused connections.
     - Continues to next report on unrecoverable errors (network, missing page, etc.), marking it “ERR”.
     - All exceptions are logged in the developer pane; users see concise status updates.
 
@@ -36,34 +40,44 @@ Dependencies:
     - Python 3.8+
     - selenium
     - tkinter (standard library)
-    - difflib, hashlib, threading, urllib.parse (standard library)
+    - csv, difflib, hashlib, threading, queue, concurrent.futures, urllib.parse (standard library)
     - Chrome browser matching the bundled chromedriver.exe
 
 Packaging:
     - To bundle as a standalone executable, use PyInstaller or similar.  `get_chromedriver_path()` locates the driver at runtime.
 """
 
+import csv
 import os
 import sys
-import re
 import hashlib
+import itertools
+import json
+import queue
+import shutil
+import tempfile
+import random
+import re
 import threading
 import time
 import datetime
 import difflib
 import tkinter as tk
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, filedialog, scrolledtext, ttk
 from urllib.parse import urlparse, urlunparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     TimeoutException, StaleElementReferenceException,
     WebDriverException, NoSuchElementException
 )
 from selenium.webdriver.chrome.service import Service
+from urllib3.exceptions import MaxRetryError, ProtocolError
 
 
 def get_chromedriver_path():
@@ -76,6 +90,13 @@ def get_chromedriver_path():
 # Ensure output directory exists
 OUTPUT_DIR = os.path.abspath("output")
 
+# Viewer assets that never affect the table text
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif"]
+
+# Upper bound for reports compared at once; each holds at least two Chrome
+# instances, and all of them share the MAX_COMBO_WORKERS browser budget
+MAX_PARALLEL_REPORTS = 8
+
 
 # ─── LOGGING ABSTRACTION ─────────────────────────────────────────────────────
 class Log:
@@ -97,92 +118,185 @@ class Log:
         self.dev_fn(message)
 
 
+# ─── RETRY BACKOFF ────────────────────────────────────────────────────────────
+RETRY_ATTEMPTS = 5
+
+
+def backoff_delay(attempt):
+    """
+    Exponential backoff with jitter: ~0.25 s, 0.5 s, 1 s, 2 s ... plus up to 0.25 s.
+    """
+    return (2 ** attempt) * 0.25 + random.uniform(0, 0.25)
+
+
+# Chrome network errors worth another page load; anything else (timeouts,
+# unresolvable hosts, script errors) fails fast
+_TRANSIENT_LOAD_ERRORS = (
+    "ERR_CONNECTION_RESET", "ERR_CONNECTION_CLOSED", "ERR_CONNECTION_ABORTED",
+    "ERR_CONNECTION_REFUSED", "ERR_NETWORK_CHANGED", "ERR_EMPTY_RESPONSE",
+)
+
+
+def is_transient_load_error(e):
+    """
+    True for dropped or refused connections, to the server (Chrome net errors)
+    or to chromedriver (surfaced by Selenium as urllib3 errors).
+    """
+    if isinstance(e, (ConnectionError, MaxRetryError, ProtocolError)):
+        return True
+    if isinstance(e, TimeoutException):
+        return False
+    return any(code in str(e) for code in _TRANSIENT_LOAD_ERRORS)
+
+
 # ─── APPLY A SINGLE PARAMETER ────────────────────────────────────────────────
+# In-page helper that applies one parameter without further WebDriver
+# round-trips. Returns 'ok', or a short reason string when the control or
+# option is not (yet) present so the Python side can retry.
+_APPLY_PARAM_JS = """
+window.__applyParam = function(name, value) {
+    var root = document.querySelector("div[data-parametername='" + name + "']");
+    if (!root) return 'no-root';
+    var fire = function(el, type) { el.dispatchEvent(new Event(type, {bubbles: true})); };
+
+    // MULTISELECT
+    var btn = root.querySelector('button');
+    if (btn) {
+        var drop = document.getElementById(btn.id.replace('_ctl01', '_divDropDown'));
+        if (!drop) return 'no-dropdown';
+        var boxes = drop.querySelectorAll("input[type='checkbox']");
+        if (!boxes.length) return 'no-options';
+        var target = null;
+        if (value.toLowerCase() === 'all') {
+            target = boxes[0];
+        } else {
+            // one scan for every option label instead of a lookup per checkbox
+            var labels = {};
+            var scope = drop.querySelector('label[for]') ? drop : document;
+            scope.querySelectorAll('label[for]').forEach(function(l) {
+                labels[l.htmlFor] = l.innerText.trim();
+            });
+            for (var i = 0; i < boxes.length; i++) {
+                if (labels[boxes[i].id] === value) { target = boxes[i]; break; }
+            }
+        }
+        if (!target) return 'no-option';
+        if (!target.checked) target.click();
+        fire(target, 'change');
+        document.body.click();
+        return 'ok';
+    }
+
+    // SINGLE-SELECT
+    var sel = root.querySelector('select');
+    if (sel) {
+        for (var j = 0; j < sel.options.length; j++) {
+            if (sel.options[j].text.trim() === value) {
+                sel.value = sel.options[j].value;
+                fire(sel, 'change');
+                return 'ok';
+            }
+        }
+        return 'no-option';
+    }
+
+    // TEXT/DATE
+    var inp = root.querySelector("input[type='text']");
+    if (!inp) return 'no-input';
+    inp.value = value;
+    fire(inp, 'change');
+    return 'ok';
+};
+"""
+
+
+def inject_param_helpers(driver):
+    """
+    Installs the in-page parameter helper. Must be re-run after every page load.
+    """
+    driver.execute_script(_APPLY_PARAM_JS)
+
+
 def apply_one_parameter(driver, name, value, log):
     """
-    Clicks + selects one parameter. Retries up to 3x on transient errors.
+    Clicks + selects one parameter in a single in-page script call.
+    Retries up to 5x on transient errors: stale references immediately,
+    everything else after an exponential backoff.
     """
-    for attempt in range(3):
+    last_error = None
+    for attempt in range(RETRY_ATTEMPTS):
         try:
-            root = driver.find_element(
-                By.CSS_SELECTOR, f"div[data-parametername='{name}']")
             log.dev(
                 f"[DEBUG] Applying parameter '{name}' -> '{value}' (attempt {attempt+1})")
+            result = driver.execute_script(
+                "return typeof __applyParam === 'function'"
+                " ? __applyParam(arguments[0], arguments[1]) : 'no-helper';",
+                name, value)
 
-            # MULTISELECT
-            if root.find_elements(By.TAG_NAME, 'button'):
-                btn = root.find_element(By.TAG_NAME, 'button')
-                btn_id = btn.get_attribute('id')
-                drop_id = btn_id.replace('_ctl01', '_divDropDown')
-                WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, btn_id)))
-                btn.click()
-                WebDriverWait(driver, 5).until(
-                    lambda d: d.find_element(By.ID, drop_id).is_displayed())
-                drop = driver.find_element(By.ID, drop_id)
-
-                if value.lower() == 'all':
-                    cb = drop.find_element(
-                        By.CSS_SELECTOR, "input[type='checkbox']")
-                    if not cb.is_selected():
-                        cb.click()
-                else:
-                    for cb in drop.find_elements(By.CSS_SELECTOR, "input[type='checkbox']"):
-                        cid = cb.get_attribute('id')
-                        lbl = driver.find_element(
-                            By.CSS_SELECTOR, f"label[for='{cid}']").text.strip()
-                        if lbl == value:
-                            if not cb.is_selected():
-                                cb.click()
-                            break
-
-                driver.find_element(By.TAG_NAME, 'body').click()
-                WebDriverWait(driver, 5).until(
-                    EC.invisibility_of_element_located((By.ID, drop_id)))
-
-            # SINGLE-SELECT
-            elif root.find_elements(By.TAG_NAME, 'select'):
-                sel = Select(root.find_element(By.TAG_NAME, 'select'))
-                sel.select_by_visible_text(value)
-
-            # TEXT/DATE
-            else:
-                inp = root.find_element(By.CSS_SELECTOR, "input[type='text']")
-                driver.execute_script(
-                    "arguments[0].value=arguments[1];arguments[0].dispatchEvent(new Event('change'));",
-                    inp, value
-                )
+            # Postbacks from dependent parameters reload the page and drop the helper
+            if result == 'no-helper':
+                inject_param_helpers(driver)
+                result = driver.execute_script(
+                    "return __applyParam(arguments[0], arguments[1]);", name, value)
+
+            if result != 'ok':
+                raise NoSuchElementException(
+                    f"parameter '{name}' value '{value}': {result}")
 
             return  # success
 
         except (TimeoutException, StaleElementReferenceException,
                 NoSuchElementException, WebDriverException) as e:
+            last_error = e
             log.dev(
                 f"[WARN] apply_one_parameter '{name}' attempt {attempt+1} failed: {e}")
-            time.sleep(1)
+            if isinstance(e, StaleElementReferenceException):
+                continue  # the next attempt looks the control up afresh
+            if attempt < RETRY_ATTEMPTS - 1:
+                time.sleep(backoff_delay(attempt))
 
     # all retries failed
-    raise RuntimeError(f"Failed to apply parameter '{name}' after 3 attempts")
+    raise RuntimeError(
+        f"Failed to apply parameter '{name}' after {RETRY_ATTEMPTS} attempts: {last_error}"
+    ) from last_error
 
 
 # ─── PARAMETER NAME + LABEL DISCOVERY ─────────────────────────────────────────
-def discover_parameter_names(driver, log):
+# Reads every parameter root with its name and label in one script call
+_DISCOVER_PARAMS_JS = """
+return Array.from(document.querySelectorAll('div[data-parametername]')).map(function(root) {
+    var lbl = document.querySelector("label[for^='" + root.id + "']");
+    return {id: root.id, name: root.getAttribute('data-parametername'),
+            label: lbl ? lbl.innerText.trim() : null};
+});
+"""
+
+# (report, rs_url) -> [(label, name)] for the current Compare run
+_LABEL_MAP_CACHE = {}
+
+
+def discover_parameter_names(driver, log, cache_key=None):
     """
-    Returns a list of (label_text, parameter_name) tuples.
+    Returns a list of (label_text, parameter_name) tuples in render order.
+    Non-empty results are memoized under `cache_key` when given; an empty
+    page (error, login, partial load) is always discovered again.
     """
+    if cache_key is not None and cache_key in _LABEL_MAP_CACHE:
+        log.dev(f"[DEBUG] Using cached parameter labels for {cache_key[0]}")
+        return _LABEL_MAP_CACHE[cache_key]
+
     mappings = []
-    elems = driver.find_elements(By.CSS_SELECTOR, "div[data-parametername]")
-    log.dev(f"[DEBUG] Found {len(elems)} parameters for label discovery")
-    for root in elems:
-        try:
-            cid = root.get_attribute('id')
-            name = root.get_attribute("data-parametername")
-            label = driver.find_element(
-                By.CSS_SELECTOR, f"label[for^='{cid}']").text.strip()
-            log.dev(f"[DEBUG] Mapped label '{label}' → name '{name}'")
-            mappings.append((label, name))
-        except Exception as e:
-            log.dev(f"[WARN] Skipping parameter root={root}: {e}")
+    params = driver.execute_script(_DISCOVER_PARAMS_JS)
+    log.dev(f"[DEBUG] Found {len(params)} parameters for label discovery")
+    for p in params:
+        if p['label'] is None:
+            log.dev(f"[WARN] Skipping parameter id={p['id']}: no label found")
+            continue
+        log.dev(f"[DEBUG] Mapped label '{p['label']}' → name '{p['name']}'")
+        mappings.append((p['label'], p['name']))
+
+    if cache_key is not None and mappings:
+        _LABEL_MAP_CACHE[cache_key] = mappings
     return mappings
 
 
@@ -204,52 +318,259 @@ def remap_user_params(user_params, label_name_map, log):
     return remapped
 
 
+# ─── OUTPUT PATHS ─────────────────────────────────────────────────────────────
+# Folders already created during the current Compare run, so each is only
+# stat-ed once per run; cleared when a run starts in case folders were deleted
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(folder):
+    if folder not in _ENSURED_DIRS:
+        os.makedirs(folder, exist_ok=True)
+        _ENSURED_DIRS.add(folder)
+
+
+def combo_output_path(report, prefix, combo_name):
+    """
+    Path of a per-combo output file, e.g. output/<report>/<server>-<combo>.txt.
+    """
+    safe = combo_name.replace(';', '_')
+    return os.path.join(OUTPUT_DIR, report, f"{prefix}-{safe}.txt")
+
+
+# ─── OPTION ENUMERATION ───────────────────────────────────────────────────────
+# Dumps control type, options and current value for each named parameter
+_PARAM_OPTIONS_JS = """
+return arguments[0].map(function(name) {
+    var root = document.querySelector("div[data-parametername='" + name + "']");
+    if (!root) return {type: 'missing', options: [], default_text: ''};
+    if (root.querySelector('button')) return {type: 'multiselect', options: ['all'], default_text: ''};
+    var sel = root.querySelector('select');
+    if (sel) {
+        var texts = Array.from(sel.options).map(function(o) { return o.text.trim(); });
+        return {type: 'select', default_text: sel.selectedIndex >= 0 ? texts[sel.selectedIndex] : '',
+                options: texts.filter(function(t) { return t && t.toLowerCase() !== '<select a value>'; })};
+    }
+    var inp = root.querySelector("input[type='text']");
+    return {type: 'text', options: [], default_text: inp ? inp.value : ''};
+});
+"""
+
+
+def enumerate_options(driver, param_names, params, log):
+    """
+    Returns one option list per parameter: the user's values when given,
+    otherwise what the page offers (read in a single script call).
+    """
+    missing = [n for n in param_names if not params.get(n)]
+    found = dict(zip(missing, driver.execute_script(_PARAM_OPTIONS_JS, missing))) if missing else {}
+
+    opts_per_param = []
+    for name in param_names:
+        if params.get(name):
+            opts_per_param.append(params[name])
+            continue
+        info = found[name]
+        if info['type'] == 'missing':
+            raise RuntimeError(f"Parameter '{name}' not found on page")
+        if info['type'] == 'text':
+            opts = [info['default_text'] or datetime.date.today().strftime('%-m/%-d/%Y')]
+        else:
+            opts = info['options']
+        if not opts:
+            # e.g. a dependent select that stays empty until its parent is chosen;
+            # zero combos would otherwise report a false "All matched"
+            raise RuntimeError(
+                f"Parameter '{name}' has no options on the initial page; list its values in the CSV")
+        log.dev(f"[DEBUG] Options for '{name}' ({info['type']}): {opts}")
+        opts_per_param.append(opts)
+    return opts_per_param
+
+
+# ─── RENDER CACHE ─────────────────────────────────────────────────────────────
+class CacheStore:
+    """
+    Persists combo hashes under <output>/.cache so unchanged combos can skip
+    rendering on later runs. Entries expire after `ttl` seconds.
+    """
+
+    # Bump whenever row normalization or hashing changes so old entries miss
+    VERSION = 3
+
+    def __init__(self, folder, log, ttl=24 * 60 * 60):
+        self.folder = folder
+        self.log = log
+        self.ttl = ttl
+        os.makedirs(folder, exist_ok=True)
+
+    @classmethod
+    def key(cls, rs_url, combo_desc, ignore_times):
+        raw = f"{cls.VERSION}|{rs_url}|{combo_desc}|{ignore_times}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.folder, f"{key}.json")
+
+    def get(self, key):
+        """Returns the cached hash, or None if missing or expired."""
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('timestamp', 0) > self.ttl:
+            return None
+        return entry.get('hash')
+
+    def put(self, key, checksum):
+        path = self._path(key)
+        tmp = path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'hash': checksum, 'timestamp': time.time()}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            self.log.dev(f"[WARN] Could not write cache entry {path}: {e}")
+
+    def clear(self):
+        removed = 0
+        for name in os.listdir(self.folder):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.folder, name))
+                removed += 1
+        return removed
+
+
+# ─── SESSION COMBO MEMO ───────────────────────────────────────────────────────
+# fingerprint -> hash of every combo rendered during the current Compare run
+_COMBO_HASH_MEMO = {}
+
+
+def combo_fingerprint(rs_url, combo, ignore_times):
+    """
+    Identifies a render independent of the CSV report name and parameter order:
+    the server URL plus the (name, value) pairs, sorted with values lowercased.
+    """
+    canonical = sorted((n, v.lower()) for n, v in combo)
+    return hashlib.sha256(repr((rs_url, canonical, ignore_times)).encode()).hexdigest()
+
+
 # ─── RENDER & HASH ────────────────────────────────────────────────────────────
-def render_and_hash(driver, combo_name, server, report, log, ignore_times=False):
+# Collects every rendered table row, collapses whitespace, optionally strips
+# time strings like "HH:MM[:SS] AM/PM", drops blank rows and sorts, all in the
+# page so only the clean rows cross the WebDriver wire.
+_REPORT_ROWS_JS = r"""
+var stripTimes = arguments[0];
+return Array.from(document.querySelectorAll(
+    "div[id^='VisibleReportContentReportViewerControl'] table tr"
+)).map(function(tr) {
+    var row = tr.innerText.replace(/\s+/g, ' ').trim();
+    if (stripTimes) row = row.replace(/\b\d{1,2}:\d{2}(?::\d{2})?(?:\s?[AP]M)?\b/gi, '');
+    return row;
+}).filter(Boolean).sort();
+"""
+
+
+# CDP expression that resolves as soon as report rows exist (false after the
+# given ms), replacing WebDriverWait's 0.5 s polling with awaited round-trips
+_ROWS_READY_JS = r"""
+new Promise(function(res) {
+    var sel = "div[id^='VisibleReportContentReportViewerControl'] table tr";
+    if (document.querySelector(sel)) return res(true);
+    var timer = setTimeout(function() { obs.disconnect(); res(false); }, %d);
+    var obs = new MutationObserver(function() {
+        if (document.querySelector(sel)) { obs.disconnect(); clearTimeout(timer); res(true); }
+    });
+    obs.observe(document.documentElement, {childList: true, subtree: true});
+})
+"""
+
+
+# Longest single CDP await; kept well under the WebDriver client's HTTP timeout
+ROW_WAIT_SLICE = 20
+
+
+def wait_for_rows(driver, log, timeout=300):
     """
-    Renders the report, collects all table rows, normalizes whitespace,
-    saves them to output/, and returns a SHA256 hash of the content.
+    Waits for rendered report rows via a CDP MutationObserver, awaited in
+    ROW_WAIT_SLICE-second slices until `timeout`. Falls back to WebDriverWait
+    polling if CDP is unavailable or the page navigated away.
     """
+    deadline = time.monotonic() + timeout
     try:
-        log.dev(f"[DEBUG] Rendering '{combo_name}' on {server}")
-        driver.find_element(By.CSS_SELECTOR,
-                            "input[type='submit'][value='View Report']").click()
-        WebDriverWait(driver, 300).until(
-            EC.presence_of_all_elements_located((
-                By.CSS_SELECTOR,
-                "div[id^='VisibleReportContentReportViewerControl'] table tr"
-            ))
-        )
-        rows = driver.execute_script(
-            "return Array.from("
-            "document.querySelectorAll("
-            "\"div[id^='VisibleReportContentReportViewerControl'] table tr\""
-            ")).map(tr=>tr.innerText);"
-        )
-        # normalize whitespace
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"No report rows after {timeout}s")
+            resp = driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": _ROWS_READY_JS % int(min(ROW_WAIT_SLICE, remaining) * 1000),
+                "awaitPromise": True,
+                "returnByValue": True,
+            })
+            value = resp.get("result", {}).get("value")
+            if value is True:
+                return
+            if value is not False:
+                log.dev(f"[DEBUG] CDP row wait inconclusive, polling instead: {resp.get('exceptionDetails')}")
+                break
+    except TimeoutException:
+        raise
+    except WebDriverException as e:
+        log.dev(f"[DEBUG] CDP row wait failed, polling instead: {e}")
 
-        lines = [re.sub(r"\s+", " ", r).strip() for r in rows]
+    remaining = max(1, deadline - time.monotonic())
+    WebDriverWait(driver, remaining).until(
+        EC.presence_of_all_elements_located((
+            By.CSS_SELECTOR,
+            "div[id^='VisibleReportContentReportViewerControl'] table tr"
+        ))
+    )
 
-        # optionally strip out any time strings like "HH:MM[:SS] AM/PM"
-        if ignore_times:
-            time_pattern = re.compile(
-                r"\b\d{1,2}:\d{2}(?::\d{2})?(?:\s?[AP]M)?\b", re.IGNORECASE)
-            lines = [time_pattern.sub("", line) for line in lines]
 
-        lines = ['|'.join(r.split('\n')) for r in lines]
-        lines.sort()
+# Rendered rows held per combo until the match/mismatch decision; larger
+# reports spill to a temp file so pending combos cannot exhaust memory
+ROW_SPOOL_BYTES = 50_000_000
 
-        # save to output
-        folder = os.path.join(OUTPUT_DIR, report)
-        os.makedirs(folder, exist_ok=True)
-        safe = combo_name.replace(';', '_')
-        path = os.path.join(folder, f"{server}-{safe}.txt")
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
 
-        log.dev(f"[DEBUG] Saved rows → {path}")
-        checksum = hashlib.sha256("\n".join(lines).encode()).hexdigest()
-        return checksum
+def render_and_hash(driver, combo_name, server, report, log, ignore_times=False):
+    """
+    Renders the report, collects all table rows, normalizes whitespace,
+    and returns (BLAKE2b hash of the content, save). Rows wait in a spooled
+    temp file (in memory up to ROW_SPOOL_BYTES, then on disk) and are only
+    written to output/ when `save()` is called, e.g. once a mismatch needs a diff.
+    """
+    try:
+        log.dev(f"[DEBUG] Rendering '{combo_name}' on {server}")
+        driver.find_element(By.CSS_SELECTOR,
+                            "input[type='submit'][value='View Report']").click()
+        wait_for_rows(driver, log)
+        # rows come back normalized, without blanks, and sorted
+        lines = driver.execute_script(_REPORT_ROWS_JS, ignore_times)
+
+        # hash and spool incrementally (newline-joined); writing waits for a
+        # mismatch. The hash only tells renders apart (non-cryptographic use),
+        # so the faster BLAKE2b with a 16-byte digest replaces SHA-256.
+        h = hashlib.blake2b(digest_size=16)
+        spool = tempfile.SpooledTemporaryFile(max_size=ROW_SPOOL_BYTES)
+        for n, line in enumerate(lines):
+            data = line.encode()
+            if n:
+                h.update(b"\n")
+                spool.write(b"\n")
+            h.update(data)
+            spool.write(data)
+        del lines
+
+        def save():
+            # the report folder is created by compare_reports before rendering
+            path = combo_output_path(report, server, combo_name)
+            spool.seek(0)
+            with open(path, 'wb') as f:
+                shutil.copyfileobj(spool, f)
+            log.dev(f"[DEBUG] Saved rows → {path}")
+            return path
+
+        return h.hexdigest(), save
 
     except Exception as e:
         log.dev(
@@ -258,23 +579,54 @@ def render_and_hash(driver, combo_name, server, report, log, ignore_times=False)
 
 
 # ─── DIFF GENERATION ──────────────────────────────────────────────────────────
-def generate_diff(report, combo_name, s1, s2, log):
+# First line of a row diff, telling it apart from a unified diff
+ROW_DIFF_HEADER = "# row diff (order ignored)"
+
+
+def row_diff(f1, f2):
     """
-    Generates a unified diff between the two saved combo files and writes it.
+    Yields a minimal +/- diff of two sorted row files in O(N), treating them as
+    multisets. Only the first file is held in memory (as counts).
     """
-    folder = os.path.join(OUTPUT_DIR, report)
-    safe = combo_name.replace(';', '_')
-    f1 = os.path.join(folder, f"{s1}-{safe}.txt")
-    f2 = os.path.join(folder, f"{s2}-{safe}.txt")
+    with open(f1, encoding='utf-8') as a:
+        counts = Counter(line.rstrip('\n') for line in a)
+    yield ROW_DIFF_HEADER
+    yield f"--- {f1}"
+    yield f"+++ {f2}"
+    added = []
+    with open(f2, encoding='utf-8') as b:
+        for line in b:
+            line = line.rstrip('\n')
+            if counts[line] > 0:
+                counts[line] -= 1
+            else:
+                added.append(line)
+    for line in sorted(counts.elements()):
+        yield f"-{line}"
+    for line in added:
+        yield f"+{line}"
+
+
+def generate_diff(report, combo_name, s1, s2, log, rich=False):
+    """
+    Diffs the two saved combo files and writes the result: a fast row diff by
+    default, or a full unified diff when `rich` is set.
+    """
+    f1 = combo_output_path(report, s1, combo_name)
+    f2 = combo_output_path(report, s2, combo_name)
+    diff_path = combo_output_path(report, 'diff', combo_name)
     try:
-        diff = difflib.unified_diff(
-            open(f1, encoding='utf-8').read().splitlines(),
-            open(f2, encoding='utf-8').read().splitlines(),
-            fromfile=f1, tofile=f2, lineterm=""
-        )
-        diff_path = os.path.join(folder, f"diff-{safe}.txt")
+        if rich:
+            # SequenceMatcher needs indexable sequences, so the lines are read in full
+            with open(f1, encoding='utf-8') as a, open(f2, encoding='utf-8') as b:
+                diff = difflib.unified_diff(
+                    a.read().splitlines(), b.read().splitlines(),
+                    fromfile=f1, tofile=f2, lineterm=""
+                )
+        else:
+            diff = row_diff(f1, f2)
         with open(diff_path, 'w', encoding='utf-8') as df:
-            df.write("\n".join(diff))
+            df.writelines(line + "\n" for line in diff)
         log.dev(f"[DEBUG] Diff saved → {diff_path}")
         return diff_path
     except Exception as e:
@@ -282,23 +634,105 @@ def generate_diff(report, combo_name, s1, s2, log):
         return None
 
 
+# ─── DRIVER POOL ──────────────────────────────────────────────────────────────
+def create_driver(log):
+    """
+    Launches a headless ChromeDriver. Retries up to 3x on startup failures.
+    Pages load eagerly with images off; only the report table text matters.
+    """
+    opts = webdriver.ChromeOptions()
+    opts.add_argument("--headless=new")
+    opts.set_capability("pageLoadStrategy", "eager")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-gpu")
+    opts.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2})
+    chromedriver = get_chromedriver_path()
+    log.dev(f"[DEBUG] Using ChromeDriver at {chromedriver}")
+    for attempt in range(3):
+        try:
+            driver = webdriver.Chrome(service=Service(chromedriver), options=opts)
+            # Stylesheets stay loaded: innerText depends on CSS visibility
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs",
+                                       {"urls": BLOCKED_URL_PATTERNS})
+            except WebDriverException as e:
+                log.dev(f"[WARN] Could not block image requests: {e}")
+            return driver
+        except WebDriverException as e:
+            log.dev(f"[WARN] ChromeDriver start attempt {attempt+1} failed: {e}")
+            time.sleep(1)
+    raise RuntimeError("Failed to start ChromeDriver after 3 attempts")
+
+
+class DriverPool:
+    """
+    Long-lived ChromeDrivers keyed by (server, domain), shared across every
+    report of a run so Chrome start-up is paid once per browser. Idle drivers
+    wait in a per-key queue; a new one is started only when all are busy, so
+    the pool never grows past the browsers in use at once (see combo_worker_count).
+    """
+
+    def __init__(self, log):
+        self.log = log
+        self.drivers = []
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, server, domain):
+        with self._lock:
+            idle = self._idle.setdefault((server, domain), queue.Queue())
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            pass
+        self.log.dev(f"[DEBUG] Starting pooled browser for {server}.{domain}")
+        driver = create_driver(self.log)
+        with self._lock:
+            self.drivers.append(driver)
+        return driver
+
+    def release(self, server, domain, driver):
+        with self._lock:
+            self._idle[(server, domain)].put(driver)
+
+    def discard(self, driver):
+        """Quits a broken driver and forgets it; the next acquire starts a fresh one."""
+        with self._lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            self.log.dev(f"[WARN] Error closing browser: {e}")
+
+    def close_all(self):
+        with self._lock:
+            self.log.dev(f"[DEBUG] Closing {len(self.drivers)} pooled browser(s)")
+            for driver in self.drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    self.log.dev(f"[WARN] Error closing browser: {e}")
+            self.drivers.clear()
+            self._idle.clear()
+
+
 # ─── REPORT CLIENT ────────────────────────────────────────────────────────────
 class ReportClient:
     """
     Encapsulates a Selenium ChromeDriver tied to a specific server host.
+    Pass `pool` to borrow a pooled browser; it is then reset and returned, not quit, on close.
     """
 
-    def __init__(self, server, domain, report, log):
+    def __init__(self, server, domain, report, log, pool=None):
         self.server = server
         self.report = report
         self.log = log
-
-        opts = webdriver.ChromeOptions()
-        opts.add_argument("--headless=new")
-        chromedriver = get_chromedriver_path()
-        self.log.dev(f"[DEBUG] Using ChromeDriver at {chromedriver}")
-        service = Service(chromedriver)
-        self.driver = webdriver.Chrome(service=service, options=opts)
+        self.pool = pool
+        self.driver = pool.acquire(server, domain) if pool else create_driver(log)
         self.domain = domain
 
     def rs_url(self, base):
@@ -308,14 +742,43 @@ class ReportClient:
         return u.replace('Reports/report/', 'ReportServer?/') + '&rs:Format=HTML4.0'
 
     def load(self, rs):
+        """Loads `rs`, retrying only dropped or refused connections with backoff."""
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                self.log.dev(f"[DEBUG] Loading {rs} (attempt {attempt+1})")
+                self.driver.get(rs)
+                time.sleep(0.5)
+                inject_param_helpers(self.driver)
+                return
+            except (WebDriverException, ConnectionError,
+                    MaxRetryError, ProtocolError) as e:
+                self.log.dev(f"[WARN] Page load attempt {attempt+1} failed: {e}")
+                if not is_transient_load_error(e) or attempt == RETRY_ATTEMPTS - 1:
+                    raise RuntimeError(
+                        f"Page load failed after {attempt+1} attempt(s): {e}") from e
+                time.sleep(backoff_delay(attempt))
+
+    def reset(self):
+        """
+        Clears session state so the next report starts from a blank page.
+        Returns False if the browser did not respond.
+        """
         try:
-            self.log.dev(f"[DEBUG] Loading {rs}")
-            self.driver.get(rs)
-            time.sleep(0.5)
+            self.driver.delete_all_cookies()
+            self.driver.get("about:blank")
+            return True
         except WebDriverException as e:
-            raise RuntimeError(f"Page load failed: {e}")
+            self.log.dev(f"[WARN] Error resetting browser '{self.server}': {e}")
+            return False
 
     def close(self):
+        if self.pool:
+            if self.reset():
+                self.pool.release(self.server, self.domain, self.driver)
+            else:
+                self.log.dev(f"[DEBUG] Discarding broken browser '{self.server}'")
+                self.pool.discard(self.driver)
+            return
         try:
             self.log.dev(f"[DEBUG] Closing browser '{self.server}'")
             self.driver.quit()
@@ -323,106 +786,171 @@ class ReportClient:
             self.log.dev(f"[WARN] Error closing browser: {e}")
 
 
+# ─── COMBO WORKER SIZING ──────────────────────────────────────────────────────
+# Reports with fewer than COMBO_PARALLEL_THRESHOLD combos stay on a single
+# browser pair because extra browsers cost more to start than they save.
+# Larger ones get min(cpu_count * 2, combos) workers, one browser each. The
+# MAX_COMBO_WORKERS budget is split across the reports running in parallel,
+# so the whole run never holds more than max(MAX_COMBO_WORKERS, 2 * parallel)
+# browsers. SSRS_COMBO_WORKERS overrides the count, within the same budget.
+COMBO_PARALLEL_THRESHOLD = 20
+MAX_COMBO_WORKERS = 16
+
+
+def combo_worker_count(total_combos, parallel_reports=1):
+    """
+    Number of render threads (two per browser pair) for a report with
+    `total_combos` combos while `parallel_reports` reports run at once.
+    """
+    budget = max(2, MAX_COMBO_WORKERS // max(1, parallel_reports))
+    override = os.environ.get('SSRS_COMBO_WORKERS')
+    if override:
+        try:
+            return max(2, min(int(override), budget))
+        except ValueError:
+            pass
+    if total_combos < COMBO_PARALLEL_THRESHOLD:
+        return 2
+    return max(2, min((os.cpu_count() or 1) * 2, total_combos, budget))
+
+
 # ─── COMPARE LOGIC ────────────────────────────────────────────────────────────
-def compare_reports(base_url, s1, s2, report, user_params, log, stop_event, ignore_times=True):
+def compare_reports(base_url, s1, s2, report, user_params, log, stop_event, ignore_times=True,
+                    pool=None, cache=None, rich_diff=False, parallel_reports=1):
     """
-    Compares a single report across two servers:
+    Compares a single report across two servers, borrowing browsers from
+    `pool` and combo hashes from `cache` when given:
       - Discovers parameter labels → names.
       - Remaps any user-provided params.
-      - Recursively builds combos, applies them, and hashes+diffs.
+      - Builds every combo with itertools.product, applies them, and hashes+diffs,
+        spreading combos over combo_worker_count() threads and browser pairs.
       - Reports INFO/WARN/ERROR to the GUI.
     """
     domain = urlparse(base_url).netloc.split('.', 1)[1]
-    c1 = ReportClient(s1, domain, report, log)
-    c2 = ReportClient(s2, domain, report, log)
+    c1 = c2 = None
+    extra_clients = []
+    executor = None
 
     try:
+        if stop_event.is_set():
+            return 'ERR'
+        c1 = ReportClient(s1, domain, report, log, pool=pool)
+        c2 = ReportClient(s2, domain, report, log, pool=pool)
         rs1, rs2 = c1.rs_url(base_url), c2.rs_url(base_url)
         log.user(f"[INFO] [REPORT]: {report}")
-        log.user(f"  • Server1={rs1}")
-        log.user(f"  • Server2={rs2}")
-        log.user(f"  • Parameters from file: {user_params or 'NONE'}")
+        log.user(f"  • [{report}] Server1={rs1}")
+        log.user(f"  • [{report}] Server2={rs2}")
+        log.user(f"  • [{report}] Parameters from file: {user_params or 'NONE'}")
 
-        # Discover label→name mappings
+        # Discover label→name mappings (already in render order)
         c1.load(rs1)
-        label_map = discover_parameter_names(c1.driver, log)
+        label_map = discover_parameter_names(c1.driver, log, cache_key=(report, rs1))
         params = remap_user_params(user_params, label_map, log)
+        param_names = [n for _, n in label_map]
 
-        # Discover ordered param names
-        c1.load(rs1)
-        param_names = [n for _, n in discover_parameter_names(c1.driver, log)]
-
-        # Build combos via recursion
-        combos = []
-
-        def traverse(idx, combo):
-            if stop_event.is_set():
-                return  # immediately unwind back up
-
-            if idx >= len(param_names):
-                combos.append(combo)
-                return
-            name = param_names[idx]
-            opts = params.get(name, [])
-            if not opts:
-                # On‐the‐fly read of remaining options
-                root = c1.driver.find_element(
-                    By.CSS_SELECTOR, f"div[data-parametername='{name}']")
-                if root.find_elements(By.TAG_NAME, 'button'):
-                    opts = ['all']
-                elif root.find_elements(By.TAG_NAME, 'select'):
-                    sel = root.find_element(By.TAG_NAME, 'select')
-                    opts = [o.text for o in sel.find_elements(
-                        By.TAG_NAME, 'option') if o and o.text.lower() != '<select a value>']
-                else:
-                    val = root.find_element(
-                        By.CSS_SELECTOR, "input[type='text']").get_attribute('value') or \
-                        datetime.date.today().strftime('%-m/%-d/%Y')
-                    opts = [val]
-
-            for v in opts:
-                try:
-                    apply_one_parameter(c1.driver, name, v, log)
-                    traverse(idx+1, combo+[(name, v)])
-                except Exception as e:
-                    log.dev(f"[ERROR] Skipping combo at param '{name}': {e}")
-
-        traverse(0, [])
+        # Build combos up front; parameters are applied per combo in run()
+        opts_per_param = enumerate_options(c1.driver, param_names, params, log)
+        combos = [list(zip(param_names, choice))
+                  for choice in itertools.product(*opts_per_param)]
 
         total = len(combos)
-        log.user(f"[INFO]   • Total combos: {total}")
+        log.user(f"[INFO]   • [{report}] Total combos: {total}")
+        _ensure_dir(os.path.join(OUTPUT_DIR, report))
 
         mismatches = []
         errors = []
 
-        for i, combo in enumerate(combos, 1):
+        # Each worker thread owns one browser at a time: `pairs` per server
+        workers = combo_worker_count(total, parallel_reports)
+        pairs = max(1, workers // 2)
+        log.dev(f"[DEBUG] {report}: {total} combos → {pairs * 2} workers, {pairs} browser pair(s)")
+        idle = {s1: queue.Queue(), s2: queue.Queue()}
+        idle[s1].put(c1)
+        idle[s2].put(c2)
+        executor = ThreadPoolExecutor(max_workers=pairs * 2)
+
+        # Extra browsers start concurrently and join the idle queues as they
+        # come up; combos begin on c1/c2 meanwhile
+        def add_client(fut, server):
+            try:
+                client = fut.result()
+            except Exception as e:
+                log.dev(f"[WARN] Extra browser for {server} failed to start: {e}")
+                return
+            extra_clients.append(client)
+            idle[server].put(client)
+
+        for _ in range(pairs - 1):
+            for server in (s1, s2):
+                fut = executor.submit(ReportClient, server, domain, report, log, pool=pool)
+                fut.add_done_callback(lambda f, server=server: add_client(f, server))
+
+        # Returns (hash, save); save is None when the hash came from the memo or cache
+        def run(server, rs, combo, desc, use_cache=True):
             if stop_event.is_set():
+                return None, None
+            fingerprint = combo_fingerprint(rs, combo, ignore_times)
+            if use_cache and fingerprint in _COMBO_HASH_MEMO:
+                log.dev(f"[DEBUG] Already rendered this run: '{desc}' on {server}")
+                return _COMBO_HASH_MEMO[fingerprint], None
+            cache_key = CacheStore.key(rs, desc, ignore_times)
+            if cache and use_cache:
+                cached = cache.get(cache_key)
+                if cached:
+                    log.dev(f"[DEBUG] Cache hit for '{desc}' on {server}")
+                    return cached, None
+            client = idle[server].get()
+            try:
+                client.load(rs)
+                for n, v in combo:
+                    apply_one_parameter(client.driver, n, v, log)
+                result = render_and_hash(
+                    client.driver, desc, server, report, log, ignore_times=ignore_times)
+                _COMBO_HASH_MEMO[fingerprint] = result[0]
+                if cache:
+                    cache.put(cache_key, result[0])
+                return result
+            except Exception as e:
+                log.dev(f"[ERROR] Combo run failed ({server}): {e}")
+                return None, None
+            finally:
+                idle[server].put(client)
+
+        def submit(combo, desc, use_cache=True):
+            return (executor.submit(run, s1, rs1, combo, desc, use_cache),
+                    executor.submit(run, s2, rs2, combo, desc, use_cache))
+
+        # Combos are submitted a window ahead and reported in order; the window
+        # bounds how many rendered row lists wait in memory at once
+        pending = deque()
+        todo = iter(enumerate(combos, 1))
+        while True:
+            while len(pending) < pairs * 2 and not stop_event.is_set():
+                nxt = next(todo, None)
+                if nxt is None:
+                    break
+                i, combo = nxt
+                desc = ';'.join(f"{n}={v}" for n, v in combo)
+                log.user(f"[INFO]   [{report}] {i}) {desc}  → Checking")
+                pending.append((i, combo, desc, submit(combo, desc)))
+            if not pending:
+                break
+            if stop_event.is_set():
+                for *_, futs in pending:
+                    for f in futs:
+                        f.cancel()
                 break
-            desc = ';'.join(f"{n}={v}" for n, v in combo)
-            log.user(f"[INFO]   {i}) {desc}  → Checking")
-            res = {}
-
-            def run(client, rs, key):
-                if stop_event.is_set():
-                    return
-                try:
-                    client.load(rs)
-                    for n, v in combo:
-                        apply_one_parameter(client.driver, n, v, log)
-                    res[key] = render_and_hash(
-                        client.driver, desc, client.server, report, log, ignore_times=ignore_times)
-                except Exception as e:
-                    log.dev(f"[ERROR] Combo run failed ({client.server}): {e}")
-                    res[key] = None
 
-            t1 = threading.Thread(target=run, args=(c1, rs1, 'h1'))
-            t2 = threading.Thread(target=run, args=(c2, rs2, 'h2'))
-            t1.start()
-            t2.start()
-            t1.join()
-            t2.join()
+            i, combo, desc, (f1, f2) = pending.popleft()
+            (h1, save1), (h2, save2) = f1.result(), f2.result()
+            if h1 is not None and h2 is not None and h1 != h2 and (save1 is None or save2 is None):
+                # A memoized or cached side has no rows to diff; render it again
+                log.dev(f"[DEBUG] Re-rendering cached side(s) of '{desc}' for diff")
+                if save1 is None:
+                    h1, save1 = executor.submit(run, s1, rs1, combo, desc, False).result()
+                if save2 is None:
+                    h2, save2 = executor.submit(run, s2, rs2, combo, desc, False).result()
 
-            h1, h2 = res.get('h1'), res.get('h2')
             if h1 is None or h2 is None:
                 status = '❌ ERROR'
                 errors.append(combo)
@@ -430,20 +958,29 @@ def compare_reports(base_url, s1, s2, report, user_params, log, stop_event, igno
                 status = '✅ MATCH' if h1 == h2 else '⚠️ MISMATCH'
                 if status == '⚠️ MISMATCH':
                     mismatches.append(combo)
-                    diff = generate_diff(report, desc, s1, s2, log)
-                    if diff:
-                        log.dev(f"[DEBUG] Diff saved → {diff}")
+                    try:
+                        for save in (save1, save2):
+                            if save:
+                                save()
+                    except OSError as e:
+                        log.dev(f"[ERROR] Saving rows for '{desc}' failed: {e}")
+                        status = '❌ ERROR'
+                        errors.append(combo)
+                    else:
+                        diff = generate_diff(report, desc, s1, s2, log, rich=rich_diff)
+                        if diff:
+                            log.dev(f"[DEBUG] Diff saved → {diff}")
 
-            log.user(f"[INFO]   {i}) {desc}  → {status}")
+            log.user(f"[INFO]   [{report}] {i}) {desc}  → {status}")
 
         # Summary
         if mismatches or errors:
             issues = len(mismatches)
-            log.user(f"[INFO]   ↳ Summary: {issues}/{total} mismatches"
+            log.user(f"[INFO]   ↳ [{report}] Summary: {issues}/{total} mismatches"
                      + (" and errors" if errors else ""))
             return 'ERR' if errors else 'DIFF'
         else:
-            log.user(f"[INFO]   ↳ Summary: All matched")
+            log.user(f"[INFO]   ↳ [{report}] Summary: All matched")
             return 'OK'
     except Exception as e:
         log.user(f"[ERROR] [REPORT]: {report} → Inconclusive due to error")
@@ -452,15 +989,52 @@ def compare_reports(base_url, s1, s2, report, user_params, log, stop_event, igno
 
     finally:
         log.user(f"\n")
-        c1.close()
-        c2.close()
+        if executor:
+            executor.shutdown()
+        for client in [c1, c2] + extra_clients:
+            if client:
+                client.close()
+
+
+# ─── CSV LOADING ─────────────────────────────────────────────────────────────
+# Label=[opt1;opt2] or Label=value; group 2 is the bracketed list, group 3 a single value
+_SPEC_RE = re.compile(r"^([^=]+)=\s*(?:\[(.*)\]|(.*?))\s*$")
+
+
+def load_report_list(path):
+    """
+    Parses the report CSV into (report, url, {label: [values]}) tuples.
+    Quoted fields may contain commas.
+    """
+    data = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            cols = [c.strip() for c in row]
+            if len(cols) < 2:
+                continue
+            report, url = cols[0], cols[1]
+            params = {}
+            for spec in cols[2:]:
+                m = _SPEC_RE.match(spec)
+                if not m:
+                    continue
+                key, listed, single = m.groups()
+                params[key] = [v for v in listed.split(';') if v] if listed is not None else [single]
+            data.append((report, url, params))
+    return data
 
 
 # ─── GUI ─────────────────────────────────────────────────────────────────────
+# Log panes are refreshed in batches; older lines are dropped if a batch overflows
+LOG_FLUSH_MS = 100
+LOG_BUFFER_LINES = 10000
+
+
 class App:
     def __init__(self, root):
         self.data = []
         self.stop_event = threading.Event()  # for cancellation
+        self.pool = None  # browsers shared across one Compare run
 
         # Catch the window‑close (X) event
         root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -517,6 +1091,32 @@ class App:
         )
         self.ignore_chk.pack(side='left', padx=5)
 
+        # Full unified diffs instead of the fast row diff
+        self.rich_diff_var = tk.BooleanVar(value=False)
+        self.rich_chk = ttk.Checkbutton(
+            tf, text="Rich Diff", variable=self.rich_diff_var
+        )
+        self.rich_chk.pack(side='left', padx=5)
+
+        # Reuse hashes of previously rendered combos
+        self.use_cache_var = tk.BooleanVar(value=False)
+        self.cache_chk = ttk.Checkbutton(
+            tf, text="Use Cache", variable=self.use_cache_var
+        )
+        self.cache_chk.pack(side='left', padx=5)
+        self.clear_cache_btn = ttk.Button(tf, text="Clear Cache", command=self.clear_cache)
+        self.clear_cache_btn.pack(side='left', padx=5)
+
+        # Reports compared in parallel
+        ttk.Label(tf, text="Parallel:").pack(side='left', padx=(5, 0))
+        self.parallel_spin = ttk.Spinbox(tf, from_=1, to=MAX_PARALLEL_REPORTS, width=3)
+        self.parallel_spin.set(min(2, os.cpu_count() or 1))
+        self.parallel_spin.pack(side='left', padx=5)
+
+        # Run options share one enabled/disabled state
+        self.option_widgets = [self.ignore_chk, self.rich_chk, self.cache_chk, self.clear_cache_btn,
+                               self.parallel_spin]
+
         # --- right side: Compare / Stop always visible ---
         right_tf = ttk.Frame(tf)
         right_tf.pack(side='right', anchor='ne', padx=5)
@@ -533,7 +1133,10 @@ class App:
         self.dl = scrolledtext.ScrolledText(df, state='disabled', height=20)
         self.dl.pack(fill='both', expand=True, padx=5, pady=5)
 
+        self._u_buf = deque(maxlen=LOG_BUFFER_LINES)
+        self._d_buf = deque(maxlen=LOG_BUFFER_LINES)
         self.log = Log(self._u, self._d)
+        root.after(LOG_FLUSH_MS, self._flush_logs)
 
         # INITIAL STATE: only Load enabled
         self._set_widgets_state(load=True, compare=False, ignore=False, stop=False, output_folder=True)
@@ -542,7 +1145,8 @@ class App:
     def _set_widgets_state(self, load, compare, ignore, stop, output_folder):
         self.load_btn.config(state='normal' if load else 'disabled')
         self.compare_btn.config(state='normal' if compare else 'disabled')
-        self.ignore_chk.config(state='normal' if ignore else 'disabled')
+        for w in self.option_widgets:
+            w.config(state='normal' if ignore else 'disabled')
         self.stop_btn.config(state='normal' if stop else 'disabled')
         self.output_btn.config(state='normal' if output_folder else 'disabled')
 
@@ -551,17 +1155,25 @@ class App:
         self.stop_event.set()
         self.log.user("[INFO] Stopping...")
 
+    # Log lines from any thread are queued here and written by _flush_logs
     def _u(self, t):
-        self.ul.configure(state='normal')
-        self.ul.insert('end', t + "\n")
-        self.ul.see('end')
-        self.ul.configure(state='disabled')
+        self._u_buf.append(t)
 
     def _d(self, t):
-        self.dl.configure(state='normal')
-        self.dl.insert('end', t + "\n")
-        self.dl.see('end')
-        self.dl.configure(state='disabled')
+        self._d_buf.append(t)
+
+    def _flush_logs(self):
+        """Writes queued log lines in one insert per pane, then reschedules itself."""
+        for widget, buf in ((self.ul, self._u_buf), (self.dl, self._d_buf)):
+            batch = []
+            while buf:
+                batch.append(buf.popleft())
+            if batch:
+                widget.configure(state='normal')
+                widget.insert('end', "\n".join(batch) + "\n")
+                widget.see('end')
+                widget.configure(state='disabled')
+        root.after(LOG_FLUSH_MS, self._flush_logs)
     
     def select_output(self):
         global OUTPUT_DIR
@@ -574,7 +1186,14 @@ class App:
             self.output_lbl.config(text=f"Output: {OUTPUT_DIR}")
             self.log.user(f"[INFO] Output folder set to {OUTPUT_DIR}")
 
-    
+
+    def clear_cache(self):
+        """Force refresh: drop every cached combo hash under the output folder."""
+        cache = CacheStore(os.path.join(OUTPUT_DIR, '.cache'), self.log)
+        removed = cache.clear()
+        _LABEL_MAP_CACHE.clear()
+        self.log.user(f"[INFO] Cleared {removed} cached combo(s)")
+
     def on_closing(self):
         # Signal any running worker to stop
         self.stop_event.set()
@@ -582,6 +1201,8 @@ class App:
 
         # Give threads a moment to clean up WebDrivers
         time.sleep(0.5)
+        if self.pool:
+            self.pool.close_all()
 
         # Then destroy the window and exit
         root.destroy()
@@ -592,22 +1213,7 @@ class App:
         )
         if not path:
             return
-        self.data.clear()
-        with open(path, encoding='utf-8') as f:
-            for line in f:
-                cols = [c.strip() for c in line.split(',')]
-                if len(cols) < 2: continue
-                report, url = cols[0], cols[1]
-                params = {}
-                for spec in cols[2:]:
-                    if '=' not in spec: continue
-                    key, raw = spec.split('=', 1); raw = raw.strip()
-                    if raw.startswith('[') and raw.endswith(']'):
-                        values = [v for v in raw[1:-1].split(';') if v]
-                    else:
-                        values = [raw]
-                    params[key] = values
-                self.data.append((report, url, params))
+        self.data = load_report_list(path)
 
         self.lbl.config(text=os.path.basename(path))
         self.log.user(f"[INFO] Loaded {len(self.data)} reports from {path}")
@@ -626,14 +1232,39 @@ class App:
 
         s1, s2 = self.s1.get(), self.s2.get()
         ignore = self.ignore_times_var.get()
+        rich = self.rich_diff_var.get()
+        cache = (CacheStore(os.path.join(OUTPUT_DIR, '.cache'), self.log)
+                 if self.use_cache_var.get() else None)
+        try:
+            requested = int(self.parallel_spin.get())
+        except ValueError:
+            requested = 1
+        workers = max(1, min(requested, os.cpu_count() or 1, MAX_PARALLEL_REPORTS))
 
         def worker():
             overall = []
-            for report, u, p in self.data:
-                if self.stop_event.is_set():
-                    break
-                st = compare_reports(u, s1, s2, report, p, self.log, stop_event=self.stop_event, ignore_times=ignore)
-                overall.append((report, st))
+            self.pool = DriverPool(self.log)
+            _COMBO_HASH_MEMO.clear()
+            _ENSURED_DIRS.clear()
+            _LABEL_MAP_CACHE.clear()
+            self.log.dev(f"[DEBUG] Comparing up to {workers} report(s) in parallel")
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as reports_ex:
+                    futures = [
+                        (report, reports_ex.submit(
+                            compare_reports, u, s1, s2, report, p, self.log,
+                            stop_event=self.stop_event, ignore_times=ignore,
+                            pool=self.pool, cache=cache, rich_diff=rich,
+                            parallel_reports=workers))
+                        for report, u, p in self.data
+                    ]
+                    for report, fut in futures:
+                        if self.stop_event.is_set():
+                            fut.cancel()
+                        if not fut.cancelled():
+                            overall.append((report, fut.result()))
+            finally:
+                self.pool.close_all()
             # Summary
             self.log.user("\n[INFO] Overall Summary:")
             for r, st in overall: